@@ -28,7 +28,7 @@ from loguru import logger
 from rich import print as rich_print
 
 from . import __version__
-from .notebook import Kind, Notebook, folder2notebooks
+from .notebook import Kind, Notebook, export_many, folder2notebooks
 
 # Configure logger
 logger.configure(extra={"subprocess": ""})
@@ -86,16 +86,11 @@ def _generate_index(
     apps = apps or []
     notebooks_wasm = notebooks_wasm or []
 
-    # Export notebooks to WebAssembly
-    for nb in notebooks:
-        nb.export(output_dir=output / "notebooks", sandbox=sandbox, bin_path=bin_path)
-
-    # Export apps to WebAssembly
-    for nb in apps:
-        nb.export(output_dir=output / "apps", sandbox=sandbox, bin_path=bin_path)
-
-    for nb in notebooks_wasm:
-        nb.export(output_dir=output / "notebooks_wasm", sandbox=sandbox, bin_path=bin_path)
+    # Export each group of notebooks concurrently; the exports are dominated
+    # by waiting on the spawned marimo processes
+    export_many(notebooks, output_dir=output / "notebooks", sandbox=sandbox, bin_path=bin_path)
+    export_many(apps, output_dir=output / "apps", sandbox=sandbox, bin_path=bin_path)
+    export_many(notebooks_wasm, output_dir=output / "notebooks_wasm", sandbox=sandbox, bin_path=bin_path)
 
     # Create the full path for the index.html file
     index_path: Path = Path(output) / "index.html"
@@ -4,9 +4,11 @@ This module provides the Notebook class for representing and exporting marimo no
 """
 
 import dataclasses
+import functools
 import os
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -44,44 +46,85 @@ class Kind(Enum):
             raise ValueError(f"Invalid Kind: {value!r}. Must be one of {[k.value for k in Kind]}") from e
 
     @property
-    def command(self) -> list[str]:
-        """Get the command list associated with a specific Kind instance.
+    def command(self) -> tuple[str, ...]:
+        """Get the command associated with a specific Kind instance.
 
-        The command property returns a list of command strings that correspond
-        to different kinds of operations based on the Kind instance.
-
-        Attributes:
-            command: A list of strings representing the command.
+        The command property returns the tuple of command strings that
+        corresponds to the kind of operation. The tuples are shared module
+        constants, so each access is a dict lookup instead of a fresh list
+        allocation; callers must not mutate them.
 
         Returns:
-            list[str]: A list of command strings for the corresponding Kind instance.
+            tuple[str, ...]: The command strings for the corresponding Kind instance.
 
         """
-        commands = {
-            Kind.NB: ["marimo", "export", "html"],
-            Kind.NB_WASM: ["marimo", "export", "html-wasm", "--mode", "edit"],
-            Kind.APP: ["marimo", "export", "html-wasm", "--mode", "run", "--no-show-code"],
-        }
-        return commands[self]
+        return _COMMAND[self]
 
     @property
     def html_path(self) -> Path:
         """Provide a property to determine the HTML path for different kinds of objects.
 
-        This property computes the corresponding directory path based on the kind
-        of the object, such as notebooks, notebooks_wasm, or apps.
+        This property returns the corresponding directory path based on the kind
+        of the object, such as notebooks, notebooks_wasm, or apps. The Path
+        objects are shared module constants, so each access is a dict lookup
+        instead of a fresh Path construction.
 
         @return: A Path object representing the relevant directory path for the
             current kind.
 
         @rtype: Path
         """
-        paths = {
-            Kind.NB: Path("notebooks"),
-            Kind.NB_WASM: Path("notebooks_wasm"),
-            Kind.APP: Path("apps"),
-        }
-        return paths[self]
+        return _HTML_PATH[self]
+
+
+# Export command per kind, built once as immutable tuples
+_COMMAND = {
+    Kind.NB: ("marimo", "export", "html"),
+    Kind.NB_WASM: ("marimo", "export", "html-wasm", "--mode", "edit"),
+    Kind.APP: ("marimo", "export", "html-wasm", "--mode", "run", "--no-show-code"),
+}
+
+# Output directory per kind, built once
+_HTML_PATH = {
+    Kind.NB: Path("notebooks"),
+    Kind.NB_WASM: Path("notebooks_wasm"),
+    Kind.APP: Path("apps"),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_exec(bin_path: str | None, name: str) -> str | None:
+    """Resolve the executable to invoke, memoized per (bin_path, name).
+
+    shutil.which splits and stats every entry it walks, so resolving once per
+    directory instead of once per export matters when a whole folder of
+    notebooks is exported.
+
+    Args:
+        bin_path (str | None): The directory where the executable is located,
+            or None to rely on PATH resolution at spawn time.
+        name (str): The name of the executable.
+
+    Returns:
+        str | None: The resolved executable, or None if it cannot be found.
+
+    """
+    if not bin_path:
+        return name
+
+    # Use shutil.which to find it with platform-specific extensions (like .exe on Windows)
+    # by passing the full path as the command and using the bin_path in the PATH
+    exe = shutil.which(name, path=bin_path)
+    if exe:
+        return exe
+
+    # Fallback: try constructing the path directly
+    # This handles cases where shutil.which doesn't work with a single directory
+    exe_path = Path(bin_path) / name
+    if exe_path.is_file() and os.access(exe_path, os.X_OK):
+        return str(exe_path)
+
+    return None
 
 
 @dataclasses.dataclass(frozen=True)
@@ -133,22 +176,10 @@ class Notebook:
 
         """
         executable = "uvx"
-        if bin_path:
-            # Construct the full executable path
-            # Use shutil.which to find it with platform-specific extensions (like .exe on Windows)
-            # by passing the full path as the command and using the bin_path in the PATH
-            exe = shutil.which(executable, path=str(bin_path))
-            if not exe:
-                # Fallback: try constructing the path directly
-                # This handles cases where shutil.which doesn't work with a single directory
-                exe_path = bin_path / executable
-                if exe_path.is_file() and os.access(exe_path, os.X_OK):
-                    exe = str(exe_path)
-                else:
-                    logger.error(f"Could not find {executable} in {bin_path}")
-                    return False
-        else:
-            exe = executable
+        exe = _resolve_exec(str(bin_path) if bin_path else None, executable)
+        if not exe:
+            logger.error(f"Could not find {executable} in {bin_path}")
+            return False
 
         cmd = [exe, *self.kind.command]
         if sandbox:
@@ -191,12 +222,51 @@ class Notebook:
         """Return the display name for the notebook."""
         return self.path.stem.replace("_", " ")
 
-    @property
+    @functools.cached_property
     def html_path(self) -> Path:
-        """Return the path to the exported HTML file."""
+        """Return the path to the exported HTML file.
+
+        Cached because path and kind are frozen, so the result never changes.
+        """
         return self.kind.html_path / f"{self.path.stem}.html"
 
 
+def export_many(
+    notebooks: list[Notebook],
+    output_dir: Path,
+    sandbox: bool = True,
+    bin_path: Path | None = None,
+    max_workers: int | None = None,
+) -> list[bool]:
+    """Export several notebooks concurrently.
+
+    Each export spends nearly all of its time waiting on the spawned marimo
+    process, so submitting the whole batch to a thread pool overlaps the
+    subprocess waits instead of paying them one after another.
+
+    Args:
+        notebooks (list[Notebook]): The notebooks to export.
+        output_dir (Path): Directory where the exported HTML files will be saved.
+        sandbox (bool): Whether to run the notebooks in a sandbox. Defaults to True.
+        bin_path (Path | None): The directory where the executable is located. Defaults to None.
+        max_workers (int | None): Maximum number of concurrent exports. Defaults
+            to the ThreadPoolExecutor default.
+
+    Returns:
+        list[bool]: The export results, in the same order as the input notebooks.
+
+    """
+    if not notebooks:
+        return []
+
+    # Submit the whole batch before collecting any result
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(nb.export, output_dir=output_dir, sandbox=sandbox, bin_path=bin_path) for nb in notebooks
+        ]
+        return [future.result() for future in futures]
+
+
 def folder2notebooks(folder: Path | str | None, kind: Kind = Kind.NB) -> list[Notebook]:
     """Find all marimo notebooks in a directory."""
     if folder is None or folder == "":
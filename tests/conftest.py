@@ -3,6 +3,8 @@
 This file contains fixtures and configuration for pytest.
 """
 
+import functools
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -11,6 +13,54 @@ from unittest.mock import MagicMock
 import pytest
 
 
+def _dedup_path(path: str) -> str:
+    """Remove empty and duplicate entries from a PATH-style string.
+
+    shutil.which stats every entry it walks, so duplicated entries (common on
+    developer machines and CI images) cost redundant syscalls.
+    """
+    seen = set()
+    entries = (entry for entry in path.split(os.pathsep) if entry and not (entry in seen or seen.add(entry)))
+    return os.pathsep.join(entries)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_marimushka() -> str:
+    """Locate the marimushka executable, caching the result in memory.
+
+    shutil.which stats every $PATH entry, so the lookup is memoized: repeated
+    calls (e.g. from fixtures resolved in different scopes) hit the cache.
+
+    Returns:
+        str: The full path to the marimushka executable.
+
+    Raises:
+        RuntimeError: If the marimushka executable cannot be found.
+
+    """
+    # First, check in the same directory as the Python interpreter.
+    # In CI and virtual environments the executable is almost always there,
+    # and a single stat beats shutil.which's scan of every $PATH entry.
+    python_dir = Path(sys.executable).parent
+    venv_marimushka = python_dir / ("marimushka.exe" if os.name == "nt" else "marimushka")
+    if venv_marimushka.is_file():
+        return str(venv_marimushka)
+
+    # Fall back to a full PATH scan, skipping duplicated entries
+    marimushka_exe = shutil.which("marimushka", path=_dedup_path(os.environ.get("PATH", "")))
+    if marimushka_exe:
+        return marimushka_exe
+
+    # Check in user's local bin directory
+    local_bin = Path.home() / ".local" / "bin" / "marimushka"
+    if local_bin.exists() and local_bin.is_file():
+        return str(local_bin)
+
+    # If we still can't find it, raise an error
+    msg = "marimushka executable not found in PATH or virtual environment"
+    raise RuntimeError(msg)
+
+
 @pytest.fixture
 def mock_logger():
     """Return a mock logger instance."""
@@ -28,13 +78,17 @@ def resource_dir():
     return Path(__file__).parent / "resources"
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def marimushka_path():
     """Pytest fixture that provides the path to the marimushka executable.
 
+    The result is invariant for the whole test session, so the fixture is
+    session-scoped: the PATH scan and filesystem probes run once instead of
+    once per test.
+
     This fixture finds the marimushka executable, looking in multiple locations:
-    1. In PATH (via shutil.which)
-    2. In the same directory as the Python interpreter (for virtual environments)
+    1. In the same directory as the Python interpreter (for virtual environments)
+    2. In PATH (via shutil.which)
     3. In the user's local bin directory (~/.local/bin)
 
     Returns:
@@ -44,28 +98,4 @@ def marimushka_path():
         RuntimeError: If the marimushka executable cannot be found.
 
     """
-    # First, try to find it in PATH
-    marimushka_exe = shutil.which("marimushka")
-    if marimushka_exe:
-        return marimushka_exe
-
-    # If not in PATH, check in the same directory as the Python interpreter
-    # This handles the case where we're running in a virtual environment
-    python_dir = Path(sys.executable).parent
-    venv_marimushka = python_dir / "marimushka"
-    if venv_marimushka.exists() and venv_marimushka.is_file():
-        return str(venv_marimushka)
-
-    # Also check for .exe extension (Windows)
-    venv_marimushka_exe = python_dir / "marimushka.exe"
-    if venv_marimushka_exe.exists() and venv_marimushka_exe.is_file():
-        return str(venv_marimushka_exe)
-
-    # Check in user's local bin directory
-    local_bin = Path.home() / ".local" / "bin" / "marimushka"
-    if local_bin.exists() and local_bin.is_file():
-        return str(local_bin)
-
-    # If we still can't find it, raise an error
-    msg = "marimushka executable not found in PATH or virtual environment"
-    raise RuntimeError(msg)
+    return _find_marimushka()
@@ -3,6 +3,8 @@
 import subprocess
 from unittest.mock import patch
 
+import pytest
+
 from marimushka.export import cli, version
 
 
@@ -26,9 +28,9 @@ def test_version(mock_rich_print):
     mock_rich_print.assert_called_once()
 
 
+@pytest.mark.slow
 def test_export_run(marimushka_path):
     """Test the export command."""
-    # Run the command and capture the output
-    result = subprocess.run([marimushka_path, "export"], capture_output=True, text=True, check=True)
-    print("Command succeeded:")
-    print(result.stdout)
+    # Run the command; nothing asserts on the output, so discard it instead
+    # of capturing and decoding it
+    subprocess.run([marimushka_path, "export"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
@@ -7,17 +7,88 @@ This module contains tests for the functions in the export.py module:
 - cli
 """
 
+import io
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
-import jinja2
 import pytest
 import typer
+from jinja2.exceptions import TemplateError
 
-from marimushka.export import _generate_index, main
+from marimushka.export import _generate_index, _main_typer, callback, main
 from marimushka.notebook import Kind, folder2notebooks
 
 
+@pytest.fixture(scope="module")
+def _mock_cache():
+    """Build the invariant notebook/app mocks once for the whole module.
+
+    MagicMock construction is comparatively expensive; the mocks only record
+    calls, so they can be shared and reset between tests.
+    """
+    return {
+        "notebooks": [MagicMock(), MagicMock()],
+        "apps": [MagicMock()],
+        "notebooks_wasm": [MagicMock()],
+    }
+
+
+@pytest.fixture
+def notebook_mocks(_mock_cache):
+    """Return two reusable notebook mocks with fresh call records."""
+    for mock in _mock_cache["notebooks"]:
+        mock.reset_mock()
+    return _mock_cache["notebooks"]
+
+
+@pytest.fixture
+def app_mocks(_mock_cache):
+    """Return a reusable app mock with fresh call records."""
+    for mock in _mock_cache["apps"]:
+        mock.reset_mock()
+    return _mock_cache["apps"]
+
+
+@pytest.fixture
+def notebook_wasm_mocks(_mock_cache):
+    """Return a reusable wasm notebook mock with fresh call records."""
+    for mock in _mock_cache["notebooks_wasm"]:
+        mock.reset_mock()
+    return _mock_cache["notebooks_wasm"]
+
+
+@pytest.fixture(scope="session")
+def jinja_env_factory():
+    """Return a factory building pre-configured jinja2.Environment mocks.
+
+    The environment mock hierarchy is identical across the _generate_index
+    tests, so one session-scoped builder replaces the per-test setup.
+    """
+
+    def _make(render_return="<html>Rendered content</html>"):
+        env = MagicMock()
+        env.return_value.get_template.return_value.render.return_value = render_return
+        return env
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def empty_dir(tmp_path_factory):
+    """Session-scoped empty folder; its contents never change, so one mkdtemp suffices."""
+    return tmp_path_factory.mktemp("empty")
+
+
+@pytest.fixture(scope="session")
+def notebooks_dir(tmp_path_factory):
+    """Session-scoped folder holding two static notebook files."""
+    folder = tmp_path_factory.mktemp("nb")
+    (folder / "notebook1.py").write_text("# Test notebook 1")
+    (folder / "notebook2.py").write_text("# Test notebook 2")
+    return folder
+
+
 class TestFolder2Notebooks:
     """Tests for the _folder2notebooks function."""
 
@@ -37,32 +108,22 @@ class TestFolder2Notebooks:
         # Assert
         assert result == []
 
-    def test_folder2notebooks_empty(self, tmp_path):
+    def test_folder2notebooks_empty(self, empty_dir):
         """Test _folder2notebooks with empty folder."""
-        # Setup
-        empty_folder = tmp_path / "empty"
-        empty_folder.mkdir()
-
         # Execute
-        result = folder2notebooks(folder=empty_folder)
+        result = folder2notebooks(folder=empty_dir)
 
         # Assert
         assert result == []
 
-    def test_folder2notebooks_with_notebooks(self, tmp_path):
+    def test_folder2notebooks_with_notebooks(self, notebooks_dir):
         """Test _folder2notebooks with notebooks."""
         # Setup
-        notebooks_folder = tmp_path / "notebooks"
-        notebooks_folder.mkdir()
-
-        # Create some test notebook files
-        notebook1 = notebooks_folder / "notebook1.py"
-        notebook2 = notebooks_folder / "notebook2.py"
-        notebook1.write_text("# Test notebook 1")
-        notebook2.write_text("# Test notebook 2")
+        notebook1 = notebooks_dir / "notebook1.py"
+        notebook2 = notebooks_dir / "notebook2.py"
 
         # Execute
-        result = folder2notebooks(folder=notebooks_folder, kind=Kind.NB)
+        result = folder2notebooks(folder=notebooks_dir, kind=Kind.NB)
 
         # Assert
         assert len(result) == 2
@@ -73,32 +134,48 @@ class TestFolder2Notebooks:
         assert str(notebook2) in notebook_paths
 
 
+class _IndexWriter(io.StringIO):
+    """In-memory file double whose contents stay readable after close().
+
+    Cheaper than mock_open, which synthesizes a full MagicMock file protocol
+    when only write() is exercised.
+    """
+
+    def close(self):
+        """Keep the buffer alive so tests can read it after the with-block."""
+
+
 class TestGenerateIndex:
     """Tests for the _generate_index function."""
 
-    @patch.object(Path, "open", new_callable=mock_open)
-    @patch("jinja2.Environment")
-    def test_generate_index_success(self, mock_env, mock_file_open, tmp_path):
+    def test_generate_index_success(
+        self, monkeypatch, tmp_path, notebook_mocks, app_mocks, notebook_wasm_mocks, jinja_env_factory
+    ):
         """Test the successful generation of index.html."""
         # Setup
         output_dir = tmp_path / "output"
         template_file = Path("template_dir/template.html.j2")
 
-        # Create mock notebooks and apps
-        mock_notebook1 = MagicMock()
-        mock_notebook2 = MagicMock()
-        mock_app1 = MagicMock()
+        # Patch the file write and the Jinja2 environment
+        writer = _IndexWriter()
+        opened = []
 
-        mock_notebook1_wasm = MagicMock()
+        def fake_open(path, mode="r"):
+            opened.append((path, mode))
+            return writer
 
-        notebooks = [mock_notebook1, mock_notebook2]
-        apps = [mock_app1]
-        notebooks_wasm = [mock_notebook1_wasm]
+        monkeypatch.setattr(Path, "open", fake_open)
+        mock_env = jinja_env_factory()
+        monkeypatch.setattr("jinja2.Environment", mock_env)
+        mock_template = mock_env.return_value.get_template.return_value
 
-        # Mock the template rendering
-        mock_template = MagicMock()
-        mock_env.return_value.get_template.return_value = mock_template
-        mock_template.render.return_value = "<html>Rendered content</html>"
+        # Reuse the shared mock notebooks and apps
+        mock_notebook1, mock_notebook2 = notebook_mocks
+        mock_app1 = app_mocks[0]
+
+        notebooks = notebook_mocks
+        apps = app_mocks
+        notebooks_wasm = notebook_wasm_mocks
 
         # Execute
         result = _generate_index(
@@ -119,30 +196,27 @@ class TestGenerateIndex:
         mock_env.assert_called_once()
         mock_env.return_value.get_template.assert_called_once_with(template_file.name)
         mock_template.render.assert_called_once_with(notebooks=notebooks, apps=apps, notebooks_wasm=notebooks_wasm)
-        mock_file_open.assert_called_once_with(output_dir / "index.html", "w")
-        mock_file_open().write.assert_called_once_with("<html>Rendered content</html>")
+        assert opened == [(output_dir / "index.html", "w")]
+        assert writer.getvalue() == "<html>Rendered content</html>"
 
         # Check that the function returns the rendered HTML
         assert result == "<html>Rendered content</html>"
 
-    @patch.object(Path, "open", side_effect=OSError("File error"))
-    @patch("jinja2.Environment")
-    def test_generate_index_file_error(self, mock_env, mock_file_open, tmp_path):
+    def test_generate_index_file_error(self, monkeypatch, tmp_path, notebook_mocks, jinja_env_factory):
         """Test handling of file error during index generation."""
         # Setup
         output_dir = tmp_path / "output"
         template_file = Path("template_dir/template.html.j2")
 
-        # Create mock notebooks
-        mock_notebook = MagicMock()
+        # Patch the file write to fail and mock the Jinja2 environment
+        monkeypatch.setattr(Path, "open", Mock(side_effect=OSError("File error")))
+        monkeypatch.setattr("jinja2.Environment", jinja_env_factory())
+
+        # Reuse a shared mock notebook
+        mock_notebook = notebook_mocks[0]
         notebooks = [mock_notebook]
         apps = []
 
-        # Mock the template rendering
-        mock_template = MagicMock()
-        mock_env.return_value.get_template.return_value = mock_template
-        mock_template.render.return_value = "<html>Rendered content</html>"
-
         # Execute and Assert (should not raise an exception)
         result = _generate_index(output=output_dir, template_file=template_file, notebooks=notebooks, apps=apps)
 
@@ -152,21 +226,22 @@ class TestGenerateIndex:
         # Check that the function returns the rendered HTML even if there's a file error
         assert result == "<html>Rendered content</html>"
 
-    @patch("jinja2.Environment")
-    @patch.object(Path, "mkdir")
-    def test_generate_index_template_error(self, mock_mkdir, mock_env, tmp_path):
+    def test_generate_index_template_error(self, monkeypatch, tmp_path, notebook_mocks, jinja_env_factory):
         """Test handling of template error during index generation."""
         # Setup
         output_dir = tmp_path / "output"
         template_file = Path("template_dir/template.html.j2")
+        monkeypatch.setattr(Path, "mkdir", MagicMock())
+        mock_env = jinja_env_factory()
+        monkeypatch.setattr("jinja2.Environment", mock_env)
 
-        # Create mock notebooks
-        mock_notebook = MagicMock()
+        # Reuse a shared mock notebook
+        mock_notebook = notebook_mocks[0]
         notebooks = [mock_notebook]
         apps = []
 
         # Mock the template error
-        mock_env.side_effect = jinja2.exceptions.TemplateError("Template error")
+        mock_env.side_effect = TemplateError("Template error")
 
         # Execute and Assert (should not raise an exception)
         result = _generate_index(output=output_dir, template_file=template_file, notebooks=notebooks, apps=apps)
@@ -181,15 +256,13 @@ class TestGenerateIndex:
 class TestMain:
     """Tests for the main function."""
 
-    @patch("marimushka.export.folder2notebooks")
-    @patch("marimushka.export._generate_index")
-    def test_main_success(self, mock_generate_index, mock_folder2notebooks):
+    def test_main_success(self, monkeypatch, notebook_mocks, app_mocks, notebook_wasm_mocks):
         """Test successful execution of the main function."""
         # Setup
-        mock_notebooks = [MagicMock(), MagicMock()]
-        mock_apps = [MagicMock()]
-        mock_notebooks_wasm = [MagicMock()]
-        mock_folder2notebooks.side_effect = [mock_notebooks, mock_apps, mock_notebooks_wasm]
+        mock_folder2notebooks = MagicMock(side_effect=[notebook_mocks, app_mocks, notebook_wasm_mocks])
+        mock_generate_index = MagicMock()
+        monkeypatch.setattr("marimushka.export.folder2notebooks", mock_folder2notebooks)
+        monkeypatch.setattr("marimushka.export._generate_index", mock_generate_index)
 
         # Execute
         main()
@@ -201,12 +274,13 @@ class TestMain:
         mock_folder2notebooks.assert_any_call(folder="notebooks", kind=Kind.NB_WASM)
         mock_generate_index.assert_called_once()
 
-    @patch("marimushka.export.folder2notebooks")
-    @patch("marimushka.export._generate_index")
-    def test_main_no_notebooks_or_apps(self, mock_generate_index, mock_folder2notebooks):
+    def test_main_no_notebooks_or_apps(self, monkeypatch):
         """Test handling of no notebooks or apps found."""
         # Setup
-        mock_folder2notebooks.return_value = []
+        mock_folder2notebooks = MagicMock(return_value=[])
+        mock_generate_index = MagicMock()
+        monkeypatch.setattr("marimushka.export.folder2notebooks", mock_folder2notebooks)
+        monkeypatch.setattr("marimushka.export._generate_index", mock_generate_index)
 
         # Execute
         main()
@@ -218,16 +292,13 @@ class TestMain:
         mock_folder2notebooks.assert_any_call(folder="notebooks", kind=Kind.NB_WASM)
         mock_generate_index.assert_not_called()
 
-    @patch("marimushka.export.folder2notebooks")
-    @patch("marimushka.export._generate_index")
-    def test_main_custom_paths(self, mock_generate_index, mock_folder2notebooks, tmp_path):
+    def test_main_custom_paths(self, monkeypatch, tmp_path, notebook_mocks, app_mocks, notebook_wasm_mocks):
         """Test main function with custom paths."""
         # Setup
-        mock_notebooks = [MagicMock(), MagicMock()]
-        mock_apps = [MagicMock()]
-        mock_notebooks_wasm = [MagicMock()]
-
-        mock_folder2notebooks.side_effect = [mock_notebooks, mock_apps, mock_notebooks_wasm]
+        mock_folder2notebooks = MagicMock(side_effect=[notebook_mocks, app_mocks, notebook_wasm_mocks])
+        mock_generate_index = MagicMock()
+        monkeypatch.setattr("marimushka.export.folder2notebooks", mock_folder2notebooks)
+        monkeypatch.setattr("marimushka.export._generate_index", mock_generate_index)
 
         custom_output = tmp_path / "custom_output"
         custom_template = tmp_path / "custom_template.html.j2"
@@ -252,9 +323,9 @@ class TestMain:
         mock_generate_index.assert_called_once_with(
             output=custom_output,
             template_file=custom_template,
-            notebooks=mock_notebooks,
-            apps=mock_apps,
-            notebooks_wasm=mock_notebooks_wasm,
+            notebooks=notebook_mocks,
+            apps=app_mocks,
+            notebooks_wasm=notebook_wasm_mocks,
             sandbox=True,
             bin_path=None,
         )
@@ -263,15 +334,15 @@ class TestMain:
 class TestCallback:
     """Tests for the callback function."""
 
-    @patch("builtins.print")
-    def test_callback_without_command(self, mock_print):
+    def test_callback_without_command(self, monkeypatch):
         """Test callback function when no command is provided."""
-        from marimushka.export import callback
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
 
-        # Setup - create a mock context with no subcommand
-        mock_ctx = MagicMock(spec=typer.Context)
-        mock_ctx.invoked_subcommand = None
-        mock_ctx.get_help.return_value = "Help text"
+        # Setup - create a lightweight stand-in context with no subcommand.
+        # A SimpleNamespace avoids MagicMock's spec introspection of typer.Context;
+        # only get_help needs call tracking, so it alone is a Mock.
+        mock_ctx = SimpleNamespace(invoked_subcommand=None, get_help=Mock(return_value="Help text"))
 
         # Execute and Assert - should raise typer.Exit
         with pytest.raises(typer.Exit):
@@ -283,11 +354,8 @@ class TestCallback:
 
     def test_callback_with_command(self):
         """Test callback function when a command is provided."""
-        from marimushka.export import callback
-
-        # Setup - create a mock context with a subcommand
-        mock_ctx = MagicMock(spec=typer.Context)
-        mock_ctx.invoked_subcommand = "export"
+        # Setup - create a lightweight stand-in context with a subcommand
+        mock_ctx = SimpleNamespace(invoked_subcommand="export", get_help=Mock(return_value="Help text"))
 
         # Execute - should not raise any exception
         callback(mock_ctx)
@@ -299,10 +367,10 @@ class TestCallback:
 class TestMainTyper:
     """Tests for the _main_typer function."""
 
-    @patch("marimushka.export.main")
-    def test_main_typer_with_option_objects(self, mock_main):
+    def test_main_typer_with_option_objects(self, monkeypatch):
         """Test _main_typer function with typer.Option objects."""
-        from marimushka.export import _main_typer
+        mock_main = MagicMock()
+        monkeypatch.setattr("marimushka.export.main", mock_main)
 
         # Setup - create mock Option objects with default attributes
         mock_output = MagicMock()
@@ -348,10 +416,10 @@ class TestMainTyper:
             bin_path="/custom/bin",
         )
 
-    @patch("marimushka.export.main")
-    def test_main_typer_with_string_values(self, mock_main):
+    def test_main_typer_with_string_values(self, monkeypatch):
         """Test _main_typer function with string values (not Option objects)."""
-        from marimushka.export import _main_typer
+        mock_main = MagicMock()
+        monkeypatch.setattr("marimushka.export.main", mock_main)
 
         # Execute with regular string values
         _main_typer(
@@ -5,11 +5,77 @@ This module contains tests for the Notebook class and Kind enum in the notebook.
 
 import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
-from marimushka.notebook import Kind, Notebook
+from marimushka.notebook import Kind, Notebook, _resolve_exec, export_many
+
+# Canned subprocess.run results. Notebook.export only reads returncode,
+# stdout and stderr, so plain namespaces shared across tests replace the
+# per-test MagicMock(returncode=...) allocations.
+_OK = SimpleNamespace(returncode=0, stdout="", stderr="")
+_FAIL = SimpleNamespace(returncode=1, stdout="", stderr="Export failed")
+
+
+class _Recorder:
+    """Minimal subprocess.run double that records calls as plain tuples."""
+
+    def __init__(self):
+        self.calls = []
+        self.result = _OK
+        self.exc = None
+
+    def __call__(self, *args, **kwargs):
+        """Record the call, then return the canned result or raise."""
+        self.calls.append((args, kwargs))
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def _clear_exec_cache():
+    """Clear the _resolve_exec memoization so its state cannot leak between tests."""
+    _resolve_exec.cache_clear()
+    yield
+    _resolve_exec.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def fake_run(monkeypatch):
+    """Patch subprocess.run once per test with a plain call recorder.
+
+    One attribute write replaces the @patch("subprocess.run") decorator that
+    eight tests used to apply individually; call recording becomes a
+    list.append instead of MagicMock call tracking.
+    """
+    recorder = _Recorder()
+    monkeypatch.setattr(subprocess, "run", recorder)
+    return recorder
+
+
+@pytest.fixture(scope="module")
+def nb_file(tmp_path_factory):
+    """Module-scoped real notebook stub.
+
+    A real .py file satisfies the exists()/is_file()/suffix validation in
+    Notebook.__post_init__, so tests need no Path patching at all. Notebook is
+    frozen and export() never touches the file contents, which makes the
+    fixture safe to share across the module.
+    """
+    path = tmp_path_factory.mktemp("notebooks") / "fibonacci.py"
+    path.write_text("# stub notebook")
+    return path
+
+
+@pytest.fixture(scope="module")
+def app_file(tmp_path_factory):
+    """Module-scoped real app notebook stub."""
+    path = tmp_path_factory.mktemp("apps") / "charts.py"
+    path.write_text("# stub app")
+    return path
 
 
 class TestKind:
@@ -48,311 +114,178 @@ class TestKind:
     def test_command(self):
         """Test the command method of the Kind enum."""
         # Test all three enum values
-        assert Kind.NB.command == ["marimo", "export", "html"]
-        assert Kind.NB_WASM.command == ["marimo", "export", "html-wasm", "--mode", "edit"]
-        assert Kind.APP.command == [
+        assert Kind.NB.command == ("marimo", "export", "html")
+        assert Kind.NB_WASM.command == ("marimo", "export", "html-wasm", "--mode", "edit")
+        assert Kind.APP.command == (
             "marimo",
             "export",
             "html-wasm",
             "--mode",
             "run",
             "--no-show-code",
-        ]
+        )
 
 
 class TestNotebook:
     """Tests for the Notebook class."""
 
-    def test_init_success(self, resource_dir):
+    def test_init_success(self, nb_file):
         """Test successful initialization of a Notebook."""
-        # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
+        # Execute
+        notebook = Notebook(nb_file)
 
-        # Create a mock path that exists and is a Python file
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            # Execute
-            notebook = Notebook(notebook_path)
+        # Assert
+        assert notebook.path == nb_file
 
-            # Assert
-            assert notebook.path == notebook_path
-
-    def test_init_with_app(self, resource_dir):
+    def test_init_with_app(self, app_file):
         """Test initialization of a Notebook as an app."""
-        # Setup
-        notebook_path = resource_dir / "apps" / "charts.py"
-
-        # Create a mock path that exists and is a Python file
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            # Execute
-            notebook = Notebook(notebook_path, kind=Kind.APP)
-
-            # Assert
-            assert notebook.path == notebook_path
-            assert notebook.kind == Kind.APP
-
-    def test_init_file_not_found(self):
+        # Execute
+        notebook = Notebook(app_file, kind=Kind.APP)
+
+        # Assert
+        assert notebook.path == app_file
+        assert notebook.kind == Kind.APP
+
+    def test_init_file_not_found(self, tmp_path):
         """Test initialization with a non-existent file."""
-        # Setup
-        notebook_path = Path("nonexistent_file.py")
+        # Setup - the path simply does not exist, no mocking required
+        notebook_path = tmp_path / "nonexistent_file.py"
 
-        # Mock Path.exists to return False and execute/assert
-        with patch.object(Path, "exists", return_value=False), pytest.raises(FileNotFoundError):
+        # Execute and Assert
+        with pytest.raises(FileNotFoundError):
             Notebook(notebook_path)
 
-    def test_init_not_a_file(self):
+    def test_init_not_a_file(self, tmp_path):
         """Test initialization with a path that is not a file."""
-        # Setup
-        notebook_path = Path("directory")
-
-        # Mock Path.exists to return True and Path.is_file to return False, then execute/assert
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=False),
-            pytest.raises(ValueError),
-        ):
-            Notebook(notebook_path)
+        # Setup - a real directory exists but is not a file
+        notebook_path = tmp_path / "directory"
+        notebook_path.mkdir()
 
-    def test_init_not_python_file(self):
-        """Test initialization with a non-Python file."""
-        # Setup
-        notebook_path = Path("file.txt")
-
-        # Mock Path.exists and Path.is_file to return True, but set suffix to .txt, then execute/assert
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".txt"),
-            pytest.raises(ValueError),
-        ):
+        # Execute and Assert
+        with pytest.raises(ValueError):
             Notebook(notebook_path)
 
-    @patch("subprocess.run")
-    def test_to_wasm_success(self, mock_run, resource_dir, tmp_path):
-        """Test successful export of a notebook to WebAssembly."""
-        # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
-        output_dir = tmp_path
-
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)  # Changed to Kind.NB
-
-            # Execute
-            result = notebook.export(output_dir)
-
-            # Assert
-            assert result is True
-            mock_run.assert_called_once()
-
-            # Check that the command includes the notebook-specific flags
-            cmd_args = mock_run.call_args[0][0]
-            print(cmd_args)
-            assert "--sandbox" in cmd_args
-            assert "--no-show-code" not in cmd_args
-
-    @patch("subprocess.run")
-    def test_to_wasm_as_app(self, mock_run, resource_dir, tmp_path):
-        """Test export of a notebook as an app."""
-        # Setup
-        notebook_path = resource_dir / "apps" / "charts.py"
-        output_dir = tmp_path
-
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.APP)
-
-            # Execute
-            result = notebook.export(output_dir)
-
-            # Assert
-            assert result is True
-            mock_run.assert_called_once()
+    def test_init_not_python_file(self, tmp_path):
+        """Test initialization with a non-Python file."""
+        # Setup - a real file whose suffix is not .py
+        notebook_path = tmp_path / "file.txt"
+        notebook_path.write_text("")
 
-            # Check that the command includes the app-specific flags
-            cmd_args = mock_run.call_args[0][0]
-            assert "--mode" in cmd_args
-            assert "run" in cmd_args
-            assert "--no-show-code" in cmd_args
+        # Execute and Assert
+        with pytest.raises(ValueError):
+            Notebook(notebook_path)
 
-    @patch("subprocess.run")
-    def test_to_wasm_subprocess_error(self, mock_run, resource_dir, tmp_path):
+    @pytest.mark.parametrize(
+        ("kind", "sandbox", "included", "excluded"),
+        [
+            pytest.param(Kind.NB, True, ["--sandbox"], ["--no-show-code"], id="notebook"),
+            pytest.param(Kind.APP, True, ["--mode", "run", "--no-show-code"], [], id="app"),
+            pytest.param(Kind.NB, False, [], ["--sandbox"], id="no_sandbox"),
+        ],
+    )
+    def test_export_command_flags(self, fake_run, nb_file, app_file, tmp_path, kind, sandbox, included, excluded):
+        """Test that export builds the right command per kind/sandbox combination."""
+        # Execute
+        notebook = Notebook(app_file if kind is Kind.APP else nb_file, kind=kind)
+        result = notebook.export(tmp_path, sandbox=sandbox)
+
+        # Assert
+        assert result is True
+        assert len(fake_run.calls) == 1
+
+        # Check the kind- and sandbox-specific flags
+        cmd_args = fake_run.calls[-1][0][0]
+        for flag in included:
+            assert flag in cmd_args
+        for flag in excluded:
+            assert flag not in cmd_args
+
+    def test_to_wasm_subprocess_error(self, fake_run, nb_file, tmp_path):
         """Test handling of subprocess error during export."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
         output_dir = tmp_path
 
         # Mock subprocess error
-        mock_run.side_effect = subprocess.CalledProcessError(1, "cmd", stderr="Error message")
+        fake_run.exc = subprocess.CalledProcessError(1, "cmd", stderr="Error message")
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path)
+        # Execute
+        notebook = Notebook(nb_file)
+        result = notebook.export(output_dir)
 
-            # Execute
-            result = notebook.export(output_dir)
+        # Assert
+        assert result is False
 
-            # Assert
-            assert result is False
-
-    @patch("subprocess.run")
-    def test_to_wasm_general_exception(self, mock_run, resource_dir, tmp_path):
+    def test_to_wasm_general_exception(self, fake_run, nb_file, tmp_path):
         """Test handling of general exception during export."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
         output_dir = tmp_path
 
         # Mock general exception
-        mock_run.side_effect = Exception("Unexpected error")
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path)
+        fake_run.exc = Exception("Unexpected error")
 
-            # Execute
-            result = notebook.export(output_dir)
-
-            # Assert
-            assert result is False
-
-    @patch("subprocess.run")
-    def test_export_no_sandbox(self, mock_run, resource_dir, tmp_path):
-        """Test export of a notebook without sandbox."""
-        # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
-        output_dir = tmp_path
+        # Execute
+        notebook = Notebook(nb_file)
+        result = notebook.export(output_dir)
 
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
-
-            # Execute
-            result = notebook.export(output_dir, sandbox=False)
-
-            # Assert
-            assert result is True
-            mock_run.assert_called_once()
-
-            # Check that the command does NOT include --sandbox
-            cmd_args = mock_run.call_args[0][0]
-            assert "--sandbox" not in cmd_args
+        # Assert
+        assert result is False
 
     @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_export_bin_path(self, mock_run, mock_which, resource_dir, tmp_path):
+    def test_export_bin_path(self, mock_which, fake_run, nb_file, tmp_path):
         """Test export of a notebook with a bin path."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
         output_dir = tmp_path
         bin_path = Path("/custom/bin")
         executable = "uvx"
 
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
         # Mock shutil.which to return the path
         mock_which.return_value = str(bin_path / executable)
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+        # Execute
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        result = notebook.export(output_dir, bin_path=bin_path)
 
-            # Execute
-            result = notebook.export(output_dir, bin_path=bin_path)
+        # Assert
+        assert result is True
+        assert len(fake_run.calls) == 1
 
-            # Assert
-            assert result is True
-            mock_run.assert_called_once()
+        # Check that the command starts with the combined path
+        cmd_args = fake_run.calls[-1][0][0]
+        # shutil.which returns the full path, so we check if it ends with the executable name
+        assert cmd_args[0].endswith(executable)
 
-            # Check that the command starts with the combined path
-            cmd_args = mock_run.call_args[0][0]
-            # shutil.which returns the full path, so we check if it ends with the executable name
-            assert cmd_args[0].endswith(executable)
-
-    @patch("os.access")
     @patch("shutil.which")
-    @patch("subprocess.run")
-    def test_export_bin_path_fallback_success(self, mock_run, mock_which, mock_access, resource_dir, tmp_path):
+    def test_export_bin_path_fallback_success(self, mock_which, fake_run, nb_file, tmp_path):
         """Test export of a notebook with fallback when shutil.which fails."""
-        # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
+        # Setup - a real executable stub, so no Path or os.access mocking is needed
         output_dir = tmp_path
-        bin_path = Path("/custom/bin")
+        bin_path = tmp_path / "bin"
+        bin_path.mkdir()
         executable = "uvx"
+        exe_stub = bin_path / executable
+        exe_stub.write_text("#!/bin/sh\n")
+        exe_stub.chmod(0o755)
 
         # Mock shutil.which to return None (simulating the case where it doesn't work)
         mock_which.return_value = None
-        # Mock os.access to return True (executable is accessible)
-        mock_access.return_value = True
-        # Mock successful subprocess run
-        mock_run.return_value = MagicMock(returncode=0)
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
-
-            # Mock the is_file check on the executable path
-            with patch.object(Path, "is_file", return_value=True):
-                # Execute
-                result = notebook.export(output_dir, bin_path=bin_path)
-
-                # Assert
-                assert result is True
-                mock_run.assert_called_once()
-
-                # Check that the command uses the fallback path
-                cmd_args = mock_run.call_args[0][0]
-                assert cmd_args[0] == str(bin_path / executable)
+
+        # Execute
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        result = notebook.export(output_dir, bin_path=bin_path)
+
+        # Assert
+        assert result is True
+        assert len(fake_run.calls) == 1
+
+        # Check that the command uses the fallback path
+        cmd_args = fake_run.calls[-1][0][0]
+        assert cmd_args[0] == str(exe_stub)
 
     @patch("os.access")
     @patch("shutil.which")
-    def test_export_bin_path_not_found(self, mock_which, mock_access, resource_dir, tmp_path):
+    def test_export_bin_path_not_found(self, mock_which, mock_access, fake_run, nb_file, tmp_path):
         """Test export of a notebook when bin path executable is not found."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
         output_dir = tmp_path
         bin_path = Path("/invalid/bin")
 
@@ -361,119 +294,103 @@ class TestNotebook:
         # Mock os.access to return False (executable is not accessible)
         mock_access.return_value = False
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+        # Execute - /invalid/bin/uvx does not exist, so no is_file patching needed
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        result = notebook.export(output_dir, bin_path=bin_path)
 
-            # Mock the is_file check on the executable path to return False
-            with patch.object(Path, "is_file", return_value=False):
-                # Execute
-                result = notebook.export(output_dir, bin_path=bin_path)
+        # Assert
+        assert result is False
+        assert fake_run.calls == []
 
-                # Assert
-                assert result is False
-
-    @patch("subprocess.run")
-    def test_export_nonzero_returncode(self, mock_run, resource_dir, tmp_path):
+    def test_export_nonzero_returncode(self, fake_run, nb_file, tmp_path):
         """Test export of a notebook when subprocess returns non-zero exit code."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
         output_dir = tmp_path
 
         # Mock subprocess run with non-zero returncode
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="Export failed")
-
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+        fake_run.result = _FAIL
 
-            # Execute
-            result = notebook.export(output_dir)
+        # Execute
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        result = notebook.export(output_dir)
 
-            # Assert
-            assert result is False
-            mock_run.assert_called_once()
+        # Assert
+        assert result is False
+        assert len(fake_run.calls) == 1
 
-    def test_display_name(self, resource_dir):
+    def test_display_name(self, nb_file):
         """Test the display_name property of the Notebook class."""
+        # Execute
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        display_name = notebook.display_name
+
+        # Assert
+        assert display_name == "fibonacci"
+
+    def test_display_name_with_underscores(self, tmp_path):
+        """Test the display_name property with underscores in the filename."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
+        notebook_path = tmp_path / "my_test_notebook.py"
+        notebook_path.write_text("# stub notebook")
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+        # Execute
+        notebook = Notebook(notebook_path, kind=Kind.NB)
+        display_name = notebook.display_name
 
-            # Execute
-            display_name = notebook.display_name
+        # Assert
+        assert display_name == "my test notebook"
 
-            # Assert
-            assert display_name == "fibonacci"
+    def test_html_path(self, nb_file):
+        """Test the html_path property of the Notebook class."""
+        # Execute
+        notebook = Notebook(nb_file, kind=Kind.NB)
+        html_path = notebook.html_path
 
-    def test_display_name_with_underscores(self):
-        """Test the display_name property with underscores in the filename."""
-        # Setup
-        notebook_path = Path("my_test_notebook.py")
+        # Assert
+        assert html_path == Path("notebooks") / "fibonacci.html"
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+    def test_html_path_app(self, app_file):
+        """Test the html_path property for an app notebook."""
+        # Execute
+        notebook = Notebook(app_file, kind=Kind.APP)
+        html_path = notebook.html_path
 
-            # Execute
-            display_name = notebook.display_name
+        # Assert
+        assert html_path == Path("apps") / "charts.html"
 
-            # Assert
-            assert display_name == "my test notebook"
 
-    def test_html_path(self, resource_dir):
-        """Test the html_path property of the Notebook class."""
+class TestExportMany:
+    """Tests for the export_many function."""
+
+    def test_export_many(self, fake_run, nb_file, app_file, tmp_path):
+        """Test batched export of several notebooks."""
         # Setup
-        notebook_path = resource_dir / "notebooks" / "fibonacci.py"
+        notebooks = [Notebook(nb_file, kind=Kind.NB), Notebook(app_file, kind=Kind.APP)]
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.NB)
+        # Execute
+        results = export_many(notebooks, output_dir=tmp_path)
 
-            # Execute
-            html_path = notebook.html_path
+        # Assert - one result and one subprocess invocation per notebook
+        assert results == [True, True]
+        assert len(fake_run.calls) == 2
 
-            # Assert
-            assert html_path == Path("notebooks") / "fibonacci.html"
+    def test_export_many_empty(self, fake_run, tmp_path):
+        """Test export_many with no notebooks."""
+        # Execute
+        results = export_many([], output_dir=tmp_path)
 
-    def test_html_path_app(self, resource_dir):
-        """Test the html_path property for an app notebook."""
-        # Setup
-        notebook_path = resource_dir / "apps" / "charts.py"
+        # Assert
+        assert results == []
+        assert fake_run.calls == []
 
-        # Create a notebook with mocked path validation
-        with (
-            patch.object(Path, "exists", return_value=True),
-            patch.object(Path, "is_file", return_value=True),
-            patch.object(Path, "suffix", ".py"),
-        ):
-            notebook = Notebook(notebook_path, kind=Kind.APP)
+    def test_export_many_propagates_failure(self, fake_run, nb_file, tmp_path):
+        """Test that a failing export is reported in the batched results."""
+        # Setup
+        fake_run.result = _FAIL
+        notebooks = [Notebook(nb_file, kind=Kind.NB)]
 
-            # Execute
-            html_path = notebook.html_path
+        # Execute
+        results = export_many(notebooks, output_dir=tmp_path)
 
-            # Assert
-            assert html_path == Path("apps") / "charts.html"
+        # Assert
+        assert results == [False]